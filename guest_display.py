@@ -1,148 +1,205 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-import plotly.graph_objects as go
 
 # Constants for each hotel's Green Champion
 GREEN_CHAMPIONS = {
     'Camden': {
         'name': 'Chinmay', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/chinmay.jpg'
+        'image': 'images/champions/chinmay.webp'
     },
     'Canopy': {
         'name': 'Lucyna', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/lucyna.jpg'
+        'image': 'images/champions/lucyna.webp'
     },
     'Westin': {
         'name': 'Jekaterina & Gayatri', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/westin.jpg'
+        'image': 'images/champions/westin.webp'
     },
     'St Albans': {
         'name': 'Suleman', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/suleman.jpg'
+        'image': 'images/champions/suleman.webp'
     },
     'CIV': {
         'name': 'Sufyan', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/sufyan.jpg'
+        'image': 'images/champions/sufyan.webp'
     },
     'CIE': {
         'name': 'Asina', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/asina.jpg'
+        'image': 'images/champions/asina.webp'
     },
     'EH': {
         'name': 'Roxana', 
         'role': 'Front Office Manager',
-        'image': 'images/champions/roxana.jpg'
+        'image': 'images/champions/roxana.webp'
     }
 }
 
+from functools import lru_cache
 from pathlib import Path
 import os
 
+@lru_cache(maxsize=16)
 def load_champion_image(image_path):
     """Load champion image with fallback to placeholder"""
     if os.path.exists(image_path):
         return image_path
-    return "images/placeholder.jpg"
+    return "images/placeholder.webp"
 
-def load_data():
-    """Load and prepare all data"""
-    # Create image directories if they don't exist
-    Path("images/champions").mkdir(parents=True, exist_ok=True)
-    Path("images/logos").mkdir(parents=True, exist_ok=True)
-    try:
-        # Load all required data
-        waste_df = pd.read_csv('data/waste.csv')
-        electricity_df = pd.read_csv('data/elec.csv')
-        water_df = pd.read_csv('data/water.csv')
-        occupancy_df = pd.read_csv('data/occ_sleepers.csv')
+def _parse_percent(value):
+    """Convert an occupancy string like '68.0%' to a fraction while the CSV is read"""
+    return float(value.rstrip('%')) / 100 if value else float('nan')
 
-        # Convert dates
-        for df in [waste_df, electricity_df, water_df, occupancy_df]:
-            df['Month'] = pd.to_datetime(df['Month'], format='%d/%m/%Y')
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_metrics():
+    """Return {hotel: metrics dict} built from the CSVs (cached, so reruns don't re-parse them)"""
+    # Load all required data, parsing dates in the reader rather than afterwards
+    date_opts = {'parse_dates': ['Month'], 'date_format': '%d/%m/%Y'}
+    waste_df = pd.read_csv(
+        'data/waste.csv',
+        usecols=['Month', 'Hotel', 'Recycling Rates', 'Food Waste'],
+        dtype={'Hotel': 'category', 'Recycling Rates': 'float32', 'Food Waste': 'float32'},
+        **date_opts
+    )
+    electricity_df = pd.read_csv('data/elec.csv', **date_opts)
+    water_df = pd.read_csv('data/water.csv', **date_opts)
+    occupancy_df = pd.read_csv(
+        'data/occ_sleepers.csv',
+        dtype={'Hotel': 'category'},
+        converters={'Occupancy Rate': _parse_percent},
+        **date_opts
+    )
 
-        # Convert occupancy percentage
-        occupancy_df['Occupancy Rate'] = occupancy_df['Occupancy Rate'].str.rstrip('%').astype(float) / 100
+    # Downcast float64 measures to float32; the display only needs 0-1 decimals
+    for df in [electricity_df, water_df, occupancy_df]:
+        float_cols = df.select_dtypes('float64').columns
+        df[float_cols] = df[float_cols].astype('float32')
 
-        return {
-            'waste': waste_df,
-            'electricity': electricity_df,
-            'water': water_df,
-            'occupancy': occupancy_df
-        }
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None
+    # Melt the wide (one column per hotel) utility tables to long format
+    water_df = water_df.melt(id_vars='Month', var_name='Hotel', value_name='L')
+    electricity_df = electricity_df.melt(id_vars='Month', var_name='Hotel', value_name='kWh')
+    for df in [water_df, electricity_df]:
+        df['Hotel'] = df['Hotel'].astype('category')
 
-def calculate_guest_impact(data, selected_hotel):
-    """Calculate per-guest impact metrics for selected hotel"""
-    try:
-        # Get latest month's data
-        latest_month = data['waste']['Month'].max()
-        
-        # Filter for selected hotel
-        hotel_waste = data['waste'][data['waste']['Hotel'] == selected_hotel]
-        hotel_water = data['water'][['Month', selected_hotel]]
-        hotel_electricity = data['electricity'][['Month', selected_hotel]]
-        hotel_occupancy = data['occupancy'][data['occupancy']['Hotel'] == selected_hotel]
-        
-        # Calculate water savings per guest
-        current_month_water = hotel_water[hotel_water['Month'] == latest_month][selected_hotel].sum()
-        prev_year_water = hotel_water[hotel_water['Month'] == (latest_month - pd.DateOffset(years=1))][selected_hotel].sum()
-        
-        current_month_occ = hotel_occupancy[hotel_occupancy['Month'] == latest_month]['Sleepers'].sum()
-        prev_year_occ = hotel_occupancy[hotel_occupancy['Month'] == (latest_month - pd.DateOffset(years=1))]['Sleepers'].sum()
-        
-        # Calculate water per guest
-        current_water_per_guest = current_month_water / current_month_occ if current_month_occ > 0 else 0
-        prev_water_per_guest = prev_year_water / prev_year_occ if prev_year_occ > 0 else 0
-        
-        water_saved_per_guest = max(0, (prev_water_per_guest - current_water_per_guest))
-        
-        # Calculate energy savings (CO2)
-        current_energy = hotel_electricity[hotel_electricity['Month'] == latest_month][selected_hotel].sum()
-        prev_year_energy = hotel_electricity[hotel_electricity['Month'] == (latest_month - pd.DateOffset(years=1))][selected_hotel].sum()
-        
-        current_energy_per_guest = current_energy / current_month_occ if current_month_occ > 0 else 0
-        prev_energy_per_guest = prev_year_energy / prev_year_occ if prev_year_occ > 0 else 0
-        
-        # Convert kWh to CO2 (using 0.233 kg CO2/kWh)
-        co2_saved_per_guest = max(0, (prev_energy_per_guest - current_energy_per_guest) * 0.233)
-        
-        # Get latest recycling rate for hotel
-        latest_recycling = hotel_waste[hotel_waste['Month'] == latest_month]['Recycling Rates'].mean()
-        recycling_target = 0.50  # 50% target
-        
-        # Calculate food waste reduction
-        current_food_waste = hotel_waste[hotel_waste['Month'] == latest_month]['Food Waste'].mean()
-        prev_food_waste = hotel_waste[hotel_waste['Month'] == (latest_month - pd.DateOffset(months=1))]['Food Waste'].mean()
-        food_waste_reduction = max(0, (prev_food_waste - current_food_waste))
-        
-        return {
-            'water_saved': water_saved_per_guest,
-            'co2_saved': co2_saved_per_guest,
-            'recycling_rate': latest_recycling,
-            'recycling_target': recycling_target,
-            'food_saved': food_waste_reduction,
-            'month': latest_month.strftime('%B %Y')
-        }
-    except Exception as e:
-        st.error(f"Error calculating metrics: {str(e)}")
-        return None
+    # Hotels shown on the page, taken before any month filtering so none can drop out
+    hotels = list(waste_df['Hotel'].unique())
 
-def show_guest_display():
-    """Main function to show guest sustainability display"""
-    # Page config
-    st.set_page_config(page_title="Hotel Sustainability Display", layout="wide")
+    # Months the metrics compare against
+    latest_month = waste_df['Month'].max()
+    prev_year = latest_month - pd.DateOffset(years=1)
+    prev_month = latest_month - pd.DateOffset(months=1)
+
+    # Aggregate everything the metrics need into one table keyed by hotel/month,
+    # keeping only the compared months so the groupby never sees the rest
+    combined = pd.concat([water_df, electricity_df, occupancy_df, waste_df], ignore_index=True)
+    months = [latest_month, prev_year, prev_month]
+    combined = combined[combined['Month'].isin(months)]
+    combined['Hotel'] = combined['Hotel'].astype('category')
+    agg_df = combined.groupby(['Hotel', 'Month'], observed=True).agg(
+        water=('L', 'sum'),
+        elec=('kWh', 'sum'),
+        sleepers=('Sleepers', 'sum'),
+        recycling=('Recycling Rates', 'mean'),
+        food=('Food Waste', 'mean')
+    )
+
+    # Give every hotel a row per compared month; missing totals count as 0 like an empty sum
+    agg_df = agg_df.reindex(pd.MultiIndex.from_product(
+        [hotels, months], names=['Hotel', 'Month']
+    ))
+    agg_df[['water', 'elec', 'sleepers']] = agg_df[['water', 'elec', 'sleepers']].fillna(0)
+
+    # Per-guest usage for all hotels in one vectorised pass (0 where there were no sleepers)
+    has_guests = agg_df['sleepers'] > 0
+    agg_df['water_per_guest'] = (agg_df['water'] / agg_df['sleepers']).where(has_guests, 0)
+    agg_df['elec_per_guest'] = (agg_df['elec'] / agg_df['sleepers']).where(has_guests, 0)
+
+    # Precompute every hotel's metrics so selecting a hotel is a dict lookup; only
+    # these small dicts are cached, so a cache hit doesn't unpickle any DataFrames
+    agg_rows = agg_df.to_dict('index')
+    metrics_by_hotel = {}
+    for hotel in hotels:
+        # A failure for one hotel is kept with that hotel rather than failing the whole load
+        try:
+            metrics_by_hotel[hotel] = calculate_guest_impact(agg_rows, hotel, latest_month, prev_year, prev_month)
+        except Exception as e:
+            metrics_by_hotel[hotel] = {'error': str(e)}
+    return metrics_by_hotel
+
+# Aggregates for a hotel/month with no data: totals count as 0, averages are unknown
+_EMPTY_MONTH = {
+    'water': 0, 'elec': 0, 'sleepers': 0, 'water_per_guest': 0, 'elec_per_guest': 0,
+    'recycling': float('nan'), 'food': float('nan')
+}
+
+def calculate_guest_impact(agg_rows, selected_hotel, latest_month, prev_year, prev_month):
+    """Calculate per-guest impact metrics for selected hotel"""
+    # Look up the three months we compare
+    current = agg_rows.get((selected_hotel, latest_month), _EMPTY_MONTH)
+    prev_year_row = agg_rows.get((selected_hotel, prev_year), _EMPTY_MONTH)
+    prev_month_row = agg_rows.get((selected_hotel, prev_month), _EMPTY_MONTH)
     
-    # Custom CSS for enhanced visual engagement
-    st.markdown("""
+    # Calculate water savings per guest
+    water_saved_per_guest = max(0, (prev_year_row['water_per_guest'] - current['water_per_guest']))
+    
+    # Convert kWh saved per guest to CO2 (using 0.233 kg CO2/kWh)
+    co2_saved_per_guest = max(0, (prev_year_row['elec_per_guest'] - current['elec_per_guest']) * 0.233)
+    
+    # Get latest recycling rate for hotel
+    latest_recycling = current['recycling']
+    if pd.isna(latest_recycling):
+        raise ValueError(f"no waste data for {selected_hotel} in {latest_month.strftime('%B %Y')}")
+    recycling_target = 0.50  # 50% target
+    
+    # Calculate food waste reduction
+    food_waste_reduction = max(0, (prev_month_row['food'] - current['food']))
+    
+    return {
+        'water_saved': water_saved_per_guest,
+        'co2_saved': co2_saved_per_guest,
+        'recycling_rate': latest_recycling,
+        'recycling_target': recycling_target,
+        'food_saved': food_waste_reduction,
+        'month': latest_month.strftime('%B %Y')
+    }
+
+def _render_page(selected_hotel, metrics):
+    """Build the header and guest impact HTML as a single markdown block"""
+    return f"""
+        <h1 class="green-header">Your Green Stay at</h1>
+        <h2 class="green-header" style="margin-top: -1rem;">{selected_hotel}</h2>
+        <p class="subtitle">
+            Together we're making a difference - {metrics['month']}
+        </p>
+
+        ### Your Stay Makes a Difference
+
+        <div class="metric-row">
+            <div class="metric-card">
+                <h3 style='color: #006B3E;'>{metrics['water_saved']:.0f}L Water Saved</h3>
+                <p>By reusing your towels</p>
+                <h4>= {(metrics['water_saved']/75):.1f} days of drinking water</h4>
+            </div>
+            <div class="metric-card">
+                <h3 style='color: #006B3E;'>{metrics['co2_saved']:.1f}kg CO₂ Prevented</h3>
+                <p>Using your key card for power</p>
+                <h4>= {(metrics['co2_saved']*4):.1f} miles not driven</h4>
+            </div>
+            <div class="metric-card">
+                <h3 style='color: #006B3E;'>{metrics['food_saved']*1000:.0f}g Food Saved</h3>
+                <p>Through portion control</p>
+                <h4>= {(metrics['food_saved']*1000/400):.1f} meals saved</h4>
+            </div>
+        </div>
+    """
+
+# Custom CSS for enhanced visual engagement
+_CSS = """
         <style>
         /* Base styles with enhanced visuals */
         .green-header {
@@ -159,6 +216,13 @@ def show_guest_display():
             text-align: center;
             margin-bottom: 2rem;
         }
+        .metric-row {
+            display: flex;
+            gap: 1rem;
+        }
+        .metric-row .metric-card {
+            flex: 1 1 0;
+        }
         .metric-card {
             background: linear-gradient(145deg, #ffffff, #f5f7f6);
             padding: 1.8rem;
@@ -270,6 +334,10 @@ def show_guest_display():
         
         /* Mobile optimizations */
         @media (max-width: 768px) {
+            .metric-row {
+                flex-direction: column;
+                gap: 0;
+            }
             .metric-card {
                 margin-bottom: 1.2rem;
             }
@@ -294,63 +362,41 @@ def show_guest_display():
             transition: width 1s ease-in-out;
         }
         </style>
-    """, unsafe_allow_html=True)
+"""
+
+def show_guest_display():
+    """Main function to show guest sustainability display"""
+    # Page config
+    st.set_page_config(page_title="Hotel Sustainability Display", layout="wide")
     
-    # Load data
-    data = load_data()
-    if not data:
+    # Custom CSS for enhanced visual engagement
+    st.markdown(_CSS, unsafe_allow_html=True)
+    
+    # Create image directories if they don't exist
+    Path("images/champions").mkdir(parents=True, exist_ok=True)
+    Path("images/logos").mkdir(parents=True, exist_ok=True)
+
+    # Load metrics (errors raise instead of returning None so a failed load isn't cached)
+    try:
+        metrics_by_hotel = load_metrics()
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
         return
 
     # Get list of hotels
-    hotels = sorted(data['waste']['Hotel'].unique())
+    hotels = sorted(metrics_by_hotel)
     
     # Hotel selector in center without the box
     selected_hotel = st.selectbox('Select Hotel', hotels)
     
-    # Calculate metrics for selected hotel
-    metrics = calculate_guest_impact(data, selected_hotel)
-    if not metrics:
+    # Metrics for every hotel are precomputed by load_metrics()
+    metrics = metrics_by_hotel[selected_hotel]
+    if 'error' in metrics:
+        st.error(f"Error calculating metrics: {metrics['error']}")
         return
     
-    # Header with hotel name
-    st.markdown(f"""
-        <h1 class="green-header">Your Green Stay at</h1>
-        <h2 class="green-header" style="margin-top: -1rem;">{selected_hotel}</h2>
-        <p class="subtitle">
-            Together we're making a difference - {metrics['month']}
-        </p>
-    """, unsafe_allow_html=True)
-    
-    # Guest Impact Section
-    st.markdown("### Your Stay Makes a Difference")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style='color: #006B3E;'>{metrics['water_saved']:.0f}L Water Saved</h3>
-            <p>By reusing your towels</p>
-            <h4>= {(metrics['water_saved']/75):.1f} days of drinking water</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style='color: #006B3E;'>{metrics['co2_saved']:.1f}kg CO₂ Prevented</h3>
-            <p>Using your key card for power</p>
-            <h4>= {(metrics['co2_saved']*4):.1f} miles not driven</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style='color: #006B3E;'>{metrics['food_saved']*1000:.0f}g Food Saved</h3>
-            <p>Through portion control</p>
-            <h4>= {(metrics['food_saved']*1000/400):.1f} meals saved</h4>
-        </div>
-        """, unsafe_allow_html=True)
+    # Header and guest impact cards, rendered as one block
+    st.markdown(_render_page(selected_hotel, metrics), unsafe_allow_html=True)
     
     # Hotel Journey
     st.markdown("### Our Green Journey")
@@ -0,0 +1,28 @@
+"""One-off script to build the WebP thumbnails used by guest_display.py
+
+Run from the repo root whenever a champion photo is added or replaced:
+
+    python make_thumbnails.py
+
+Each images/champions/*.jpg (and the placeholder) is shrunk to fit 300x300,
+which is enough for the 150px display at 2x, and saved next to it as .webp.
+"""
+from pathlib import Path
+
+from PIL import Image
+
+THUMBNAIL_SIZE = (300, 300)
+
+def make_thumbnail(src):
+    """Write a resized WebP copy of src alongside it and return its path"""
+    dst = src.with_suffix('.webp')
+    with Image.open(src) as img:
+        img.thumbnail(THUMBNAIL_SIZE)
+        img.save(dst, 'WEBP', quality=80)
+    return dst
+
+if __name__ == "__main__":
+    sources = sorted(Path("images/champions").glob("*.jpg")) + [Path("images/placeholder.jpg")]
+    for src in sources:
+        dst = make_thumbnail(src)
+        print(f"{src} ({src.stat().st_size // 1024}KB) -> {dst} ({dst.stat().st_size // 1024}KB)")